@@ -1,46 +1,95 @@
+import concurrent.futures
+import functools
+import json
 import os
+import shlex
+from dataclasses import dataclass
 from pathlib import Path
 import click
-from chromadb import HttpClient, PersistentClient, Settings
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.json import JSON
+from rich.live import Live
 from dotenv import load_dotenv
 
-load_dotenv()
-
 console = Console()
 
+PEEK_PAGE_SIZE = 100
+PREVIEW_LEN = 100
+
+# current directory, then parent, then user home directory; built once at
+# import so Path.home() only probes the environment a single time
+CANDIDATE_ENV_PATHS = (
+    Path('.env'),
+    Path('../.env'),
+    Path.home() / '.eureka-chroma' / '.env',
+)
 
+
+@functools.cache
 def load_config():
-    """Load config from .env files with fallbacks"""
-    # try loading from current directory
-    if Path('.env').exists():
-        load_dotenv('.env')
-    # try loading from parent directory
-    elif Path('../.env').exists():
-        load_dotenv('../.env')
-    # try loading from user home directory
-    elif Path.home().joinpath('.eureka-chroma/.env').exists():
-        load_dotenv(Path.home().joinpath('.eureka-chroma/.env'))
+    """Load config from the first .env file found, exactly once per process"""
+    env_path = next((p for p in CANDIDATE_ENV_PATHS if p.is_file()), None)
+    if env_path:
+        load_dotenv(env_path, override=False)
+
+
+@functools.lru_cache(maxsize=1024)
+def preview(s: str, n: int = PREVIEW_LEN) -> str:
+    """Truncate a document for table display; one len + one slice per unique doc"""
+    return s if len(s) <= n else s[:n] + "..."
+
+
+@functools.lru_cache(maxsize=128)
+def render_metadata(serialized: str) -> JSON:
+    """Build a rich JSON renderable, reusing the parse for repeated metadata"""
+    return JSON(serialized)
+
 
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Immutable snapshot of the Chroma connection settings"""
+    host: str | None
+    port: int
+    token: str | None
+    ssl: str | None
 
+
+@functools.cache
+def get_config() -> Config:
+    """Read the Chroma env vars once into a Config"""
+    load_config()
+    return Config(
+        host=os.getenv('CHROMA_HOST'),
+        port=int(os.getenv('CHROMA_PORT', '8000')),
+        token=os.getenv('CHROMA_TOKEN'),
+        ssl=os.getenv('CHROMA_SSL'),
+    )
+
+
+@functools.lru_cache(maxsize=1)
 def get_client():
-    """Get ChromaDB client"""
-    host = os.getenv('CHROMA_HOST')
-    token = os.getenv('CHROMA_TOKEN')
-    if not host:
+    """Get ChromaDB client (cached so one connection is reused per process)"""
+    # import lazily so --help and argument errors don't pay the multi-second
+    # chromadb import cost; remote use works with the slim chromadb-client package
+    config = get_config()
+    if not config.host:
+        from chromadb import PersistentClient, Settings
         console.print(
             "[yellow]No CHROMA_HOST set, using local persistent storage")
-        return PersistentClient(path="./chroma_data")
+        return PersistentClient(
+            path="./chroma_data",
+            settings=Settings(anonymized_telemetry=False)
+        )
 
+    from chromadb import HttpClient, Settings
     return HttpClient(
-        host=host,
-        port=int(os.getenv('CHROMA_PORT', '8000')),
+        host=config.host,
+        port=config.port,
         settings=Settings(
             chroma_client_auth_provider="chromadb.auth.token_authn.TokenAuthClientProvider",
-            chroma_client_auth_credentials=token,
+            chroma_client_auth_credentials=config.token,
         )
     )
 
@@ -52,12 +101,17 @@ def cli(ctx, verbose):
     """ChromaDB Test Bench - Debug and manage collections"""
     ctx.ensure_object(dict)
     ctx.obj['VERBOSE'] = verbose
+    config = get_config()
+    ctx.obj['CONFIG'] = config
     if verbose:
-        console.print(f"[blue]Environment:[/blue]")
-        console.print(f"CHROMA_URL: {os.getenv('CHROMA_URL')}")
-        console.print(f"CHROMA_HOST: {os.getenv('CHROMA_HOST')}")
-        console.print(f"CHROMA_PORT: {os.getenv('CHROMA_PORT')}")
-        console.print(f"CHROMA_SSL: {os.getenv('CHROMA_SSL')}")
+        # one render/write instead of a console.print per line
+        console.print(
+            f"[blue]Environment:[/blue]\n"
+            f"CHROMA_HOST: {config.host}\n"
+            f"CHROMA_PORT: {config.port}\n"
+            f"CHROMA_SSL: {config.ssl}",
+            highlight=False
+        )
 
 
 @cli.command()
@@ -122,11 +176,11 @@ def list_collections():
     table.add_column("Count")
 
     for col in collections:
-        collection = client.get_collection(col.name)
+        # the listed Collection object is fully usable, no get_collection needed
         table.add_row(
             col.name,
             # col.metadata.get("hnsw:space", "l2"),
-            str(collection.count())
+            str(col.count())
         )
 
     console.print(table)
@@ -135,12 +189,22 @@ def list_collections():
 @cli.command()
 @click.argument('name')
 @click.option('--limit', default=10, help='Number of items to show')
-def peek(name: str, limit: int):
+@click.option('--show-total/--no-show-total', default=False,
+              help='Also fetch the total item count (extra round-trip)')
+def peek(name: str, limit: int, show_total: bool):
     """Peek into a collection's contents"""
     client = get_client()
     try:
         collection = client.get_collection(name)
-        results = collection.get(limit=limit)
+
+        # fetch the first page before rendering anything so an empty
+        # collection prints just the message, no empty table scaffold
+        page_size = min(PEEK_PAGE_SIZE, limit)
+        # skip embeddings: the table only shows id/metadata/doc preview
+        results = collection.get(
+            limit=page_size,
+            include=['documents', 'metadatas']
+        )
 
         if not results['ids']:
             console.print("[yellow]Collection is empty")
@@ -151,16 +215,36 @@ def peek(name: str, limit: int):
         table.add_column("Metadata")
         table.add_column("Document Preview")
 
-        for i in range(len(results['ids'])):
-            doc_preview = results['documents'][i][:100] + "..." if len(
-                results['documents'][i]) > 100 else results['documents'][i]
-            metadata = JSON(str(results['metadatas'][i])
-                            ) if results['metadatas'][i] else ""
-            table.add_row(results['ids'][i], metadata, doc_preview)
-
-        console.print(table)
-        console.print(f"\nShowing {len(results['ids'])} of {
-                      collection.count()} total items")
+        # page the fetch and render rows as they arrive, so peak memory is
+        # bounded by the page size rather than --limit
+        shown = 0
+        with Live(table, console=console, refresh_per_second=10):
+            while True:
+                # hoist columns into locals so the loop is free of repeated dict lookups
+                ids, docs, metas = results['ids'], results['documents'], results['metadatas']
+                if not ids:
+                    break
+                for id_, doc, meta in zip(ids, docs, metas):
+                    doc_preview = preview(doc)
+                    metadata = render_metadata(json.dumps(
+                        meta, ensure_ascii=False, separators=(',', ':'),
+                        sort_keys=True)) if meta else ""
+                    table.add_row(id_, metadata, doc_preview)
+
+                shown += len(ids)
+                if len(ids) < page_size or shown >= limit:
+                    break
+                page_size = min(PEEK_PAGE_SIZE, limit - shown)
+                results = collection.get(
+                    limit=page_size,
+                    offset=shown,
+                    include=['documents', 'metadatas']
+                )
+
+        if show_total:
+            console.print(f"\nShowing {shown} of {collection.count()} total items")
+        else:
+            console.print(f"\nShowing {shown} items")
 
     except Exception as e:
         console.print(f"[red]Error: {str(e)}")
@@ -168,37 +252,37 @@ def peek(name: str, limit: int):
 
 @cli.command()
 @click.argument('name')
-@click.argument('query')
-@click.option('--n-results', default=5, help='Number of results to return')
-def search(name: str, query: str, n_results: int):
-    """Search a collection with a text query"""
+@click.argument('queries', nargs=-1, required=True)
+@click.option('--n-results', default=5, help='Number of results to return per query')
+def search(name: str, queries: tuple, n_results: int):
+    """Search a collection with one or more text queries"""
     client = get_client()
     try:
         collection = client.get_collection(name)
+        # one batched request: the server runs all queries in a single pass
+        # instead of paying a round-trip per query
         results = collection.query(
-            query_texts=[query],
-            n_results=n_results
+            query_texts=list(queries),
+            n_results=n_results,
+            include=['documents', 'metadatas', 'distances']
         )
 
-        if not results['ids']:
-            console.print("[yellow]No results found")
-            return
+        for query, ids, docs, dists in zip(
+                queries, results['ids'], results['documents'], results['distances']):
+            if not ids:
+                console.print(f"[yellow]No results found for '{query}'")
+                continue
 
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("ID")
-        table.add_column("Distance")
-        table.add_column("Document Preview")
+            table = Table(show_header=True, header_style="bold magenta",
+                          title=query if len(queries) > 1 else None)
+            table.add_column("ID")
+            table.add_column("Distance")
+            table.add_column("Document Preview")
 
-        for i in range(len(results['ids'][0])):
-            doc_preview = results['documents'][0][i][:100] + "..." if len(
-                results['documents'][0][i]) > 100 else results['documents'][0][i]
-            table.add_row(
-                results['ids'][0][i],
-                f"{results['distances'][0][i]:.4f}",
-                doc_preview
-            )
+            for id_, doc, dist in zip(ids, docs, dists):
+                table.add_row(id_, f"{dist:.4f}", preview(doc))
 
-        console.print(table)
+            console.print(table)
 
     except Exception as e:
         console.print(f"[red]Error: {str(e)}")
@@ -211,15 +295,24 @@ def stats(name: str):
     client = get_client()
     try:
         collection = client.get_collection(name)
-        results = collection.get(limit=1)
-
-        if results['embeddings']:
-            embedding_dim = len(results['embeddings'][0])
+        # fire the sample get and the count concurrently so the two
+        # round-trips overlap instead of serializing
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+            get_future = pool.submit(
+                collection.get, limit=1, include=['embeddings'])
+            count_future = pool.submit(collection.count)
+        results = get_future.result()
+        total = count_future.result()
+
+        # embeddings come back as a numpy array, whose truth value raises
+        emb = results['embeddings']
+        if emb is not None and len(emb) > 0:
+            embedding_dim = len(emb[0])
         else:
             embedding_dim = "Unknown (empty collection)"
 
         stats_table = Table(show_header=False, box=None)
-        stats_table.add_row("Total Items", str(collection.count()))
+        stats_table.add_row("Total Items", str(total))
         stats_table.add_row("Embedding Dimensions", str(embedding_dim))
         stats_table.add_row("Distance Metric",
                             collection.metadata.get("hnsw:space", "l2"))
@@ -234,5 +327,43 @@ def stats(name: str):
         console.print(f"[red]Error: {str(e)}")
 
 
+@cli.command()
+@click.pass_context
+def repl(ctx):
+    """Run commands interactively, reusing one client connection"""
+    # amortizes interpreter startup, the chromadb import, and the TCP/TLS
+    # handshake across many commands instead of paying them per invocation
+    console.print(
+        "[blue]Interactive mode — enter commands (e.g. 'list', "
+        "'peek my_collection'), 'exit' to quit")
+    while True:
+        try:
+            line = console.input("[bold]chroma> [/bold]")
+        except (EOFError, KeyboardInterrupt):
+            break
+
+        try:
+            args = shlex.split(line)
+            if not args:
+                continue
+            if args[0] in ('exit', 'quit'):
+                break
+            if args[0] == 'repl':
+                console.print("[yellow]Already in interactive mode")
+                continue
+
+            cli.main(args=args, prog_name='chroma',
+                     standalone_mode=False, obj=ctx.obj)
+        except click.ClickException as e:
+            e.show()
+        except click.exceptions.Exit:
+            pass
+        except KeyboardInterrupt:
+            # interrupt the running command, not the whole session
+            console.print("[yellow]Interrupted")
+        except Exception as e:
+            console.print(f"[red]Error: {str(e)}")
+
+
 if __name__ == '__main__':
     cli()